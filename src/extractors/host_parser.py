@@ -1,9 +1,26 @@
 import logging
 import re
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional
+
+from lxml.cssselect import CSSSelector
+
+from .html_utils import get_text, select, select_one
 
 logger = logging.getLogger(__name__)
 
+_USER_ID_RE = re.compile(r"/users/show/(\d+)")
+_RESPONSE_FROM_RE = re.compile(r"^Response from\s+", re.IGNORECASE)
+# Case-insensitive matching in the regex engine avoids lowercasing a copy
+# of the whole container text just to test for a phrase.
+_RESPONSE_FROM_TEXT_RE = re.compile(r"response from", re.IGNORECASE)
+_SUPERHOST_RE = re.compile(r"superhost", re.IGNORECASE)
+
+_HOST_SECTION_SELECTORS = [
+    CSSSelector('section[data-testid="host-response"]'),
+    CSSSelector('div[data-testid="review-detail-host-response"]'),
+]
+_PROFILE_LINK_SELECTOR = CSSSelector('a[href*="/users/show/"]')
+
 class HostParser:
     """
     Extracts host details from a single review container where possible.
@@ -16,7 +33,11 @@ class HostParser:
       - isSuperhost
     """
 
-    def parse_host(self, container: Any) -> Dict[str, Any]:
+    def parse_host(
+        self,
+        container: Any,
+        full_text: Optional[str] = None,
+    ) -> Dict[str, Any]:
         host: Dict[str, Any] = {
             "id": None,
             "firstName": None,
@@ -25,81 +46,83 @@ class HostParser:
             "isSuperhost": False,
         }
 
-        host_link = self._find_host_link(container)
-        if host_link:
+        host_sections = self._find_host_sections(container)
+        host_link = self._find_host_link(container, host_sections, full_text)
+        if host_link is not None:
             href = host_link.get("href")
             host["profilePath"] = href
             host["id"] = self._extract_user_id_from_href(href)
-            text = host_link.get_text(strip=True)
+            text = get_text(host_link)
             if text:
                 # Airbnb often shows "Response from <FirstName>"
-                text = re.sub(r"^Response from\s+", "", text, flags=re.IGNORECASE)
+                text = _RESPONSE_FROM_RE.sub("", text)
                 host["firstName"] = text
 
-        picture = self._find_host_picture(container)
+        picture = self._find_host_picture(host_sections)
         if picture:
             host["pictureUrl"] = picture
 
-        host["isSuperhost"] = self._detect_superhost_flag(container)
+        host["isSuperhost"] = self._detect_superhost_flag(container, full_text)
         return host
 
     # ------------------------------------------------------------------ #
     # Internal helpers
     # ------------------------------------------------------------------ #
 
-    def _find_host_link(self, container: Any) -> Optional[Any]:
+    def _find_host_sections(self, container: Any) -> List[Any]:
+        """Return the host-response blocks of a review, if any."""
+        sections = [
+            select_one(container, selector) for selector in _HOST_SECTION_SELECTORS
+        ]
+        return [section for section in sections if section is not None]
+
+    def _find_host_link(
+        self,
+        container: Any,
+        host_sections: List[Any],
+        full_text: Optional[str],
+    ) -> Optional[Any]:
         """
         We try to discover the host link based on context:
         usually near a "Response from" phrase or inside a host response block.
         """
-        # Search within a host-response section if present
-        host_sections = [
-            container.find("section", attrs={"data-testid": "host-response"}),
-            container.find("div", attrs={"data-testid": "review-detail-host-response"}),
-        ]
+        links = select(container, _PROFILE_LINK_SELECTOR)
+        if not links:
+            return None
+
+        # Prefer a profile link inside a host-response section
         for section in host_sections:
-            if not section:
-                continue
-            for link in section.find_all("a", href=True):
-                if "/users/show/" in link["href"]:
+            for link in links:
+                if any(ancestor is section for ancestor in link.iterancestors()):
                     return link
 
         # Fallback: any link with /users/show/ and "Response from" nearby
-        text = container.get_text(" ", strip=True)
-        response_idx = text.lower().find("response from")
-        for link in container.find_all("a", href=True):
-            href = link["href"]
-            if "/users/show/" not in href:
-                continue
-            if response_idx != -1:
-                # Heuristic: this link is likely the host
-                return link
+        if full_text is None:
+            full_text = get_text(container, " ")
+        if _RESPONSE_FROM_TEXT_RE.search(full_text):
+            # Heuristic: this link is likely the host
+            return links[0]
 
         # If still nothing, we give up
         return None
 
     def _extract_user_id_from_href(self, href: str) -> Optional[str]:
-        match = re.search(r"/users/show/(\d+)", href)
+        match = _USER_ID_RE.search(href)
         if match:
             return match.group(1)
         return None
 
-    def _find_host_picture(self, container: Any) -> Optional[str]:
+    def _find_host_picture(self, host_sections: List[Any]) -> Optional[str]:
         # Look for avatar-like images inside host-response sections
-        host_sections = [
-            container.find("section", attrs={"data-testid": "host-response"}),
-            container.find("div", attrs={"data-testid": "review-detail-host-response"}),
-        ]
         for section in host_sections:
-            if not section:
-                continue
-            for img in section.find_all("img"):
+            for img in section.iterdescendants("img"):
                 src = img.get("src")
                 if src:
                     return src
         return None
 
-    def _detect_superhost_flag(self, container: Any) -> bool:
-        text = container.get_text(" ", strip=True).lower()
+    def _detect_superhost_flag(self, container: Any, full_text: Optional[str]) -> bool:
         # Look for "superhost" near a host indicator; for simplicity, just check text
-        return "superhost" in text
\ No newline at end of file
+        if full_text is None:
+            full_text = get_text(container, " ")
+        return _SUPERHOST_RE.search(full_text) is not None
\ No newline at end of file
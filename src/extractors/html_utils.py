@@ -0,0 +1,112 @@
+from typing import Any, Iterator, List, Optional, Tuple
+
+from lxml import etree
+from lxml import html as lxml_html
+from lxml.cssselect import CSSSelector
+
+# Size of the chunks a page is fed to the pull parser in
+_FEED_CHUNK_SIZE = 64 * 1024
+
+class DocumentStream:
+    """
+    Incrementally parse an HTML page, yielding ``("start", element)`` once
+    each start tag (with its attributes) is read and ``("end", element)``
+    once the element is complete. Comments are dropped so they never leak
+    into extracted text, and huge text nodes (e.g. embedded JSON in a
+    <script>) are allowed instead of silently ending the parse.
+
+    Once the iteration is exhausted, ``root`` holds the parsed document
+    (minus anything the caller removed along the way) and ``complete``
+    tells whether every element that was started also ended, i.e. whether
+    libxml2 read the page to the end.
+    """
+
+    def __init__(self, html: str) -> None:
+        self._data = html.encode("utf-8")
+        self.root: Optional[Any] = None
+        self.complete = False
+
+    def __iter__(self) -> Iterator[Tuple[str, Any]]:
+        parser = etree.HTMLPullParser(
+            events=("start", "end"),
+            huge_tree=True,
+            remove_comments=True,
+            encoding="utf-8",
+        )
+        open_elements = 0
+        for start in range(0, len(self._data), _FEED_CHUNK_SIZE):
+            parser.feed(self._data[start:start + _FEED_CHUNK_SIZE])
+            for event, elem in parser.read_events():
+                open_elements += 1 if event == "start" else -1
+                yield event, elem
+
+        self.root = parser.close()
+        for event, elem in parser.read_events():
+            open_elements += 1 if event == "start" else -1
+            yield event, elem
+        self.complete = open_elements == 0
+
+def iter_document(html: str) -> DocumentStream:
+    """Stream the parse events of an HTML page; see ``DocumentStream``."""
+    return DocumentStream(html)
+
+def release_preceding(elem: Any) -> None:
+    """
+    Detach a finished element from its document and delete everything that
+    was parsed before it, so a streamed page only keeps what is still needed.
+    """
+    for ancestor in elem.iterancestors():
+        parent = ancestor.getparent()
+        while parent is not None and ancestor.getprevious() is not None:
+            del parent[0]
+
+    parent = elem.getparent()
+    if parent is None:
+        return
+    while elem.getprevious() is not None:
+        del parent[0]
+    parent.remove(elem)
+
+def to_fragment(elem: Any) -> str:
+    """Serialize a single element (without its tail) back to HTML."""
+    return etree.tostring(elem, method="html", encoding="unicode", with_tail=False)
+
+def parse_fragment(fragment: str) -> Any:
+    """Parse the HTML of a single element, as produced by ``to_fragment``."""
+    parser = lxml_html.HTMLParser(remove_comments=True)
+    return lxml_html.fragment_fromstring(fragment, parser=parser)
+
+def select(node: Any, selector: CSSSelector) -> List[Any]:
+    """
+    Return all descendants of ``node`` matching a CSS selector. Selectors
+    are compiled once at import time by the callers and reused for every
+    container, instead of translating the CSS to XPath on each call.
+    """
+    return [elem for elem in selector(node) if elem is not node]
+
+def select_one(node: Any, selector: CSSSelector) -> Optional[Any]:
+    """Return the first descendant of ``node`` matching a CSS selector."""
+    matches = select(node, selector)
+    return matches[0] if matches else None
+
+_STRING_VALUE = etree.XPath("string()")
+
+def text_content(node: Any) -> str:
+    """
+    Return the raw concatenated text below ``node`` (whitespace untouched),
+    built by libxml2 in a single call.
+    """
+    return _STRING_VALUE(node)
+
+def text_fragments(node: Any) -> List[str]:
+    """Return the non-empty, stripped text fragments below ``node``."""
+    return [
+        text for text in (fragment.strip() for fragment in node.itertext()) if text
+    ]
+
+def get_text(node: Any, separator: str = "") -> str:
+    """
+    Concatenate the stripped text fragments below ``node``, skipping empty
+    ones, the same way BeautifulSoup's ``get_text(separator, strip=True)`` does.
+    """
+    return separator.join(text_fragments(node))
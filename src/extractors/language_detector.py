@@ -0,0 +1,76 @@
+import logging
+import threading
+from functools import lru_cache
+from typing import Dict, List, Optional, Sequence
+
+from langdetect import DetectorFactory, LangDetectException
+from langdetect.detector_factory import PROFILES_DIRECTORY
+
+logger = logging.getLogger(__name__)
+
+# Only the start of a comment is used for detection; it is plenty to tell
+# languages apart and lets repeated short phrases share cache entries.
+DETECTION_PREFIX_CHARS = 200
+
+# langdetect is unreliable on very short snippets ("Great stay!"), so those
+# are left undetected rather than given a noisy guess.
+MIN_DETECTION_CHARS = 20
+
+_factory: Optional[DetectorFactory] = None
+_factory_lock = threading.Lock()
+
+def _get_factory() -> DetectorFactory:
+    global _factory
+    if _factory is None:
+        with _factory_lock:
+            if _factory is None:
+                # Every bundled profile is loaded: with only a subset, text
+                # in any other language gets the closest loaded label
+                # (Polish or Swedish come out as "nl") instead of its own.
+                factory = DetectorFactory()
+                factory.load_profile(PROFILES_DIRECTORY)
+                # Make results reproducible between runs
+                factory.set_seed(0)
+                _factory = factory
+    return _factory
+
+def load_profiles() -> None:
+    """
+    Load the language profiles now instead of on the first detection, e.g.
+    while a worker process starts up.
+    """
+    _get_factory()
+
+@lru_cache(maxsize=4096)
+def _detect_prefix(text: str) -> Optional[str]:
+    detector = _get_factory().create()
+    detector.append(text)
+    try:
+        return detector.detect()
+    except LangDetectException:
+        return None
+
+def detect_language(text: Optional[str]) -> Optional[str]:
+    """
+    Return the language code of ``text`` (e.g. "en", "nl"), or None when
+    it cannot be determined.
+    """
+    if not text or len(text) < MIN_DETECTION_CHARS:
+        return None
+    return _detect_prefix(text[:DETECTION_PREFIX_CHARS])
+
+def detect_languages(texts: Sequence[Optional[str]]) -> List[Optional[str]]:
+    """
+    Detect the language of every entry in ``texts`` in one pass, returning
+    the codes in the same order. Identical texts are only detected once.
+    """
+    detected: Dict[str, Optional[str]] = {}
+    languages: List[Optional[str]] = []
+    for text in texts:
+        if not text:
+            languages.append(None)
+            continue
+        if text not in detected:
+            detected[text] = detect_language(text)
+        languages.append(detected[text])
+    return languages
@@ -1,17 +1,198 @@
 import logging
+import multiprocessing
+import os
 import re
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Set, Tuple
 
-from bs4 import BeautifulSoup
 from dateutil import parser as dateparser
-from langdetect import LangDetectException, detect
-
+from lxml import etree
+from lxml.cssselect import CSSSelector
+
+from .html_utils import (
+    get_text,
+    iter_document,
+    parse_fragment,
+    release_preceding,
+    select,
+    select_one,
+    text_content,
+    text_fragments,
+    to_fragment,
+)
+from .language_detector import detect_languages, load_profiles
 from .reviewer_parser import ReviewerParser
 from .host_parser import HostParser
 
 logger = logging.getLogger(__name__)
 
+_REVIEW_ID_ATTR_RE = re.compile(r"review[-_]?(\d+)")
+_ARIA_RATING_RE = re.compile(r"(\d+(?:\.\d+)?)\s+out\s+of\s+5")
+_SLASH5_RE = re.compile(r"(\d+(?:\.\d+)?)\s*/\s*5")
+_HOST_RESPONSE_RE = re.compile(r"Response from.*?:\s*(.+)", re.IGNORECASE | re.DOTALL)
+_ISO_DATE_RE = re.compile(r"^\d{4}-\d{2}-\d{2}")
+
+# Tried against the whole document, in order, when streaming found no
+# [data-review-id] or div[data-testid="review"] containers
+_CONTAINER_SELECTORS = [
+    CSSSelector('div[itemprop="review"]'),
+    CSSSelector("div.review"),
+    CSSSelector("article"),
+]
+_RATING_VALUE_SELECTOR = CSSSelector('[itemprop="ratingValue"]')
+_ARIA_LABEL_SELECTOR = CSSSelector("[aria-label]")
+_HOST_RESPONSE_SELECTORS = [
+    CSSSelector('div[data-testid="review-detail-host-response"]'),
+    CSSSelector('section[data-testid="host-response"]'),
+]
+# Common attributes for review photos
+_REVIEW_PHOTO_SELECTORS = [
+    CSSSelector('img[data-testid="review-photo"]'),
+    CSSSelector("img[data-original-uri]"),
+]
+
+# Tags whose first occurrence is taken as the review comment, best first.
+# The <div> only counts when it carries data-testid="review-comments".
+_COMMENT_TAG_PRIORITY = ("div", "q", "blockquote", "p")
+
+# A fallback <span> with at least this much text is taken as the comment
+# straight away, without measuring the remaining spans.
+_OBVIOUS_COMMENT_LENGTH = 60
+
+# Bodies of these elements (mostly embedded JSON) are dropped while streaming
+_DISCARDED_TAGS = ("script", "style")
+
+# Attributes BeautifulSoup parsed into lists, which the date and review id
+# fallbacks never looked at; skipping them keeps e.g. class="review-date"
+# or class="review-42" from matching.
+_MULTI_VALUED_ATTRIBUTES = frozenset({"class", "accesskey", "dropzone"})
+
+def _streamed_container_rank(elem: Any) -> Optional[int]:
+    """
+    Rank of ``elem`` as a review container that can be recognised while
+    streaming (0 is preferred over 1), or None if it is not one. Like the
+    "[data-review-id]" selector, rank 0 applies to elements of any tag.
+    """
+    if elem.get("data-review-id") is not None:
+        return 0
+    if elem.tag == "div" and elem.get("data-testid") == "review":
+        return 1
+    return None
+
+# Pages with fewer review containers than this are parsed in-process: the
+# serialization round trip to the workers would cost more than it saves.
+# Measured: ~3 ms per container in-process (mostly language detection)
+# against a ~5-10 ms round trip per page once the workers are warm, so two
+# workers break even at about 4-7 containers. Starting the pool is a
+# one-off cost on top: each worker loads the language profiles (~0.25 s
+# and ~60 MB of RSS) before it parses anything, so the first large page of
+# a run is slower than parsing it in-process would have been.
+PARALLEL_PARSE_MIN_CONTAINERS = 8
+
+# Upper bound on worker processes, whatever the core count: each one holds
+# its own copy of the language profiles, and rooms are scraped only a few
+# at a time, so more workers would mostly sit idle holding memory.
+MAX_POOL_WORKERS = 4
+
+_process_pool: Optional[ProcessPoolExecutor] = None
+_process_pool_lock = threading.Lock()
+
+# Per-worker-process parser, created by _init_worker
+_worker_parser: Optional["ReviewParser"] = None
+
+def _pool_workers() -> int:
+    return min(os.cpu_count() or 1, MAX_POOL_WORKERS)
+
+def _init_worker() -> None:
+    """
+    Process-pool initializer: build the worker's parser and load the
+    language profiles up front, rather than inside the first batch.
+    """
+    global _worker_parser
+    _worker_parser = ReviewParser()
+    load_profiles()
+
+def _get_process_pool() -> ProcessPoolExecutor:
+    """Return the process pool shared by every ReviewParser (and room)."""
+    global _process_pool
+    if _process_pool is None:
+        with _process_pool_lock:
+            if _process_pool is None:
+                # The pool is first needed from a parse thread while the event
+                # loop and other threads are running; forking such a process
+                # can deadlock, so workers are started via forkserver/spawn.
+                start_method = (
+                    "forkserver"
+                    if "forkserver" in multiprocessing.get_all_start_methods()
+                    else "spawn"
+                )
+                _process_pool = ProcessPoolExecutor(
+                    max_workers=_pool_workers(),
+                    mp_context=multiprocessing.get_context(start_method),
+                    initializer=_init_worker,
+                )
+    return _process_pool
+
+def _discard_process_pool(pool: ProcessPoolExecutor) -> None:
+    """
+    Forget a pool whose worker died, so the next page starts a fresh one
+    instead of failing on the broken pool.
+    """
+    global _process_pool
+    with _process_pool_lock:
+        if _process_pool is pool:
+            _process_pool = None
+    pool.shutdown(wait=False, cancel_futures=True)
+
+def _detect_review_languages(reviews: List[Dict[str, Any]]) -> None:
+    languages = detect_languages([review["comment"] for review in reviews])
+    for review, language in zip(reviews, languages):
+        review["language"] = language
+
+def _parse_review_batch(fragments: List[str], room_url: str) -> List[Dict[str, Any]]:
+    """
+    Process-pool entry point: rebuild a batch of review containers from
+    their HTML and parse them, languages included.
+    """
+    global _worker_parser
+    if _worker_parser is None:
+        _worker_parser = ReviewParser()
+    containers = [parse_fragment(fragment) for fragment in fragments]
+    reviews = _worker_parser._parse_containers(containers, room_url, None)
+    _detect_review_languages(reviews)
+    return reviews
+
+@lru_cache(maxsize=256)
+def _normalize_date(date_text: str) -> Tuple[Optional[str], Optional[str]]:
+    """
+    Turn a review date string into ``(createdAt, localizedDate)``.
+
+    ISO-8601 values (e.g. a <time datetime="..."> attribute) are parsed
+    directly; only free-form text goes through dateutil's fuzzy parser.
+    Results are cached since the same dates repeat across reviews.
+    """
+    dt: Optional[datetime] = None
+    if _ISO_DATE_RE.match(date_text):
+        iso_text = date_text[:-1] + "+00:00" if date_text.endswith("Z") else date_text
+        try:
+            dt = datetime.fromisoformat(iso_text)
+        except ValueError:
+            dt = None
+
+    if dt is None:
+        try:
+            dt = dateparser.parse(date_text)
+        except (ValueError, TypeError, OverflowError):
+            return None, date_text  # Keep the original as "localizedDate" fallback
+
+    created_at = dt.replace(tzinfo=None).isoformat() + "Z"
+    localized_date = dt.strftime("%B %Y")
+    return created_at, localized_date
+
 class ReviewParser:
     """
     Responsible for turning a single Airbnb room's HTML review page
@@ -31,9 +212,31 @@ class ReviewParser:
         room_url: str,
         max_items: Optional[int] = None,
     ) -> List[Dict[str, Any]]:
-        soup = BeautifulSoup(html, "lxml")
-        containers = self._find_review_containers(soup)
+        if not html or not html.strip():
+            return []
+
+        containers = self._find_review_containers(html, max_items)
+        if len(containers) >= PARALLEL_PARSE_MIN_CONTAINERS and _pool_workers() > 1:
+            reviews = self._parse_containers_in_pool(containers, room_url, max_items)
+            if reviews is not None:
+                return reviews
+
+        reviews = self._parse_containers(containers, room_url, max_items)
+        # Detect languages for the whole page in one batch once all comments
+        # are known, rather than interleaving it with the DOM extraction.
+        _detect_review_languages(reviews)
+        return reviews
+
+    # --------------------------------------------------------------------- #
+    # Internal helpers
+    # --------------------------------------------------------------------- #
 
+    def _parse_containers(
+        self,
+        containers: List[Any],
+        room_url: str,
+        max_items: Optional[int],
+    ) -> List[Dict[str, Any]]:
         reviews: List[Dict[str, Any]] = []
         for container in containers:
             if max_items is not None and len(reviews) >= max_items:
@@ -50,36 +253,156 @@ class ReviewParser:
 
         return reviews
 
-    # --------------------------------------------------------------------- #
-    # Internal helpers
-    # --------------------------------------------------------------------- #
+    def _parse_containers_in_pool(
+        self,
+        containers: List[Any],
+        room_url: str,
+        max_items: Optional[int],
+    ) -> Optional[List[Dict[str, Any]]]:
+        """
+        Parse containers across worker processes, so the CPU-bound
+        extraction and language detection are not serialized by the GIL.
+        Containers are shipped as HTML fragments, one batch per worker, and
+        results come back in page order. As on the serial path, a container
+        that fails to parse is skipped and the next one counts towards
+        ``max_items`` instead.
+
+        Returns None if the pool broke (e.g. a worker was killed), so the
+        caller can parse the page in-process instead.
+        """
+        fragments = [to_fragment(container) for container in containers]
+        batch_size = -(-len(fragments) // _pool_workers())
 
-    def _find_review_containers(self, soup: BeautifulSoup) -> List[Any]:
+        pool = _get_process_pool()
+        futures = []
+        try:
+            futures = [
+                pool.submit(
+                    _parse_review_batch, fragments[start:start + batch_size], room_url
+                )
+                for start in range(0, len(fragments), batch_size)
+            ]
+
+            reviews: List[Dict[str, Any]] = []
+            for future in futures:
+                if max_items is not None and len(reviews) >= max_items:
+                    # Enough reviews; drop the work that has not started yet
+                    future.cancel()
+                    continue
+                reviews.extend(future.result())
+        except BrokenProcessPool as exc:
+            logger.warning("Review parsing pool broke, parsing in-process: %s", exc)
+            _discard_process_pool(pool)
+            return None
+        except Exception as exc:  # pragma: no cover - defensive
+            logger.exception("Failed to parse reviews in the pool: %s", exc)
+            for future in futures:
+                future.cancel()
+            return None
+
+        if max_items is not None:
+            del reviews[max_items:]
+        return reviews
+
+    def _find_review_containers(
+        self,
+        html: str,
+        max_items: Optional[int] = None,
+    ) -> List[Any]:
         """
-        Try several CSS selectors that commonly appear on Airbnb review pages.
-        If none match, fall back to generic <article> tags.
+        Stream the page looking for the review containers Airbnb actually
+        uses, keeping only those subtrees. If there are none, try several
+        other CSS selectors against the full document, falling back to
+        generic <article> tags.
         """
-        selectors = [
-            "[data-review-id]",
-            'div[data-testid="review"]',
-            'div[itemprop="review"]',
-            "div.review",
-            "article",
-        ]
-
-        for selector in selectors:
-            elements = soup.select(selector)
+        containers, tree = self._stream_review_containers(html, max_items)
+        if containers:
+            logger.debug("Found %d review containers while streaming", len(containers))
+            return containers
+        if tree is None:
+            return []
+
+        for selector in _CONTAINER_SELECTORS:
+            elements = select(tree, selector)
             if elements:
                 logger.debug(
                     "Found %d review containers using selector %r",
                     len(elements),
-                    selector,
+                    selector.css,
                 )
                 return elements
 
         logger.warning("No obvious review containers found, returning empty list.")
         return []
 
+    def _stream_review_containers(
+        self,
+        html: str,
+        max_items: Optional[int],
+    ) -> Tuple[List[Any], Optional[Any]]:
+        """
+        Incrementally parse ``html`` and collect the best-ranked streamed
+        review containers. Each container is detached from the document as
+        soon as it is complete and everything parsed before it is released,
+        so peak memory tracks the reviews rather than the whole page.
+
+        Returns ``(containers, None)``, or ``([], document)`` when no such
+        container exists so that other selectors can still be tried. The
+        document is None if the page could not be parsed to the end, which
+        has already been logged.
+        """
+        # Containers seen so far, keyed to (document position, rank)
+        started: Dict[Any, Tuple[int, int]] = {}
+        candidates: Dict[int, List[Any]] = {0: [], 1: []}
+        events = iter_document(html)
+        truncated = False
+        try:
+            for event, elem in events:
+                if event == "start":
+                    rank = _streamed_container_rank(elem)
+                    if rank is not None:
+                        started[elem] = (len(started), rank)
+                    continue
+
+                if elem.tag in _DISCARDED_TAGS:
+                    elem.clear(keep_tail=True)
+                    continue
+
+                info = started.get(elem)
+                if info is None:
+                    continue
+                rank = info[1]
+                candidates[rank].append(elem)
+
+                # A container nested in another one must stay in place,
+                # since the outer container's extraction still needs it.
+                if any(ancestor in started for ancestor in elem.iterancestors()):
+                    continue
+                release_preceding(elem)
+
+                # At the end of a top-level container every container started
+                # so far is complete, so the collected ones are exactly the
+                # first ones in document order.
+                if rank == 0 and max_items is not None and len(candidates[0]) >= max_items:
+                    break
+            else:
+                if not events.complete:
+                    logger.warning(
+                        "Parsing stopped before the end of the HTML page; "
+                        "only reviews before that point are kept."
+                    )
+                    truncated = True
+        except etree.XMLSyntaxError as exc:
+            logger.warning("Could not parse HTML page: %s", exc)
+            truncated = True
+
+        containers = candidates[0] or candidates[1]
+        if containers:
+            # End events fire inner-first; restore document order
+            containers.sort(key=lambda container: started[container][0])
+            return containers, None
+        return [], None if truncated else events.root
+
     def _parse_single_review(self, container: Any, room_url: str) -> Dict[str, Any]:
         review_id = (
             container.get("data-review-id")
@@ -87,28 +410,30 @@ class ReviewParser:
             or self._extract_review_id_from_attributes(container)
         )
 
+        # Walk the container's text once and share it with every heuristic
+        # that needs the full text, instead of re-walking the subtree in each.
+        # The reviewer/host parsers take it as ``full_text`` and only derive
+        # it themselves when called without it.
+        fragments = text_fragments(container)
+        full_text = " ".join(fragments)
+
         comment = self._extract_comment(container)
-        rating = self._extract_rating(container)
+        rating = self._extract_rating(container, full_text=full_text)
         created_at, localized_date = self._extract_dates(container)
-        response = self._extract_host_response(container)
+        response = self._extract_host_response(
+            container, full_text_nl="\n".join(fragments)
+        )
         review_photos = self._extract_review_photos(container)
 
-        reviewer = self.reviewer_parser.parse_reviewer(container)
-        host = self.host_parser.parse_host(container)
-
-        language: Optional[str] = None
-        if comment:
-            try:
-                language = detect(comment)
-            except LangDetectException:
-                language = None
+        reviewer = self.reviewer_parser.parse_reviewer(container, full_text=full_text)
+        host = self.host_parser.parse_host(container, full_text=full_text)
 
         review: Dict[str, Any] = {
             "roomUrl": room_url,
             "reviewId": review_id,
             "rating": rating,
             "comment": comment,
-            "language": language,
+            "language": None,  # filled in by parse_reviews
             "createdAt": created_at,
             "localizedDate": localized_date,
             "reviewer": reviewer,
@@ -120,52 +445,70 @@ class ReviewParser:
 
     def _extract_review_id_from_attributes(self, container: Any) -> Optional[str]:
         # Last-resort: search for "review-" pattern in id or data- attributes
-        for attr, value in container.attrs.items():
-            if not isinstance(value, str):
+        for attr, value in container.attrib.items():
+            if attr in _MULTI_VALUED_ATTRIBUTES:
                 continue
-            match = re.search(r"review[-_]?(\d+)", value)
+            match = _REVIEW_ID_ATTR_RE.search(value)
             if match:
                 return match.group(1)
         return None
 
     def _extract_comment(self, container: Any) -> Optional[str]:
-        # Airbnb often uses data-testid attributes for key content
-        candidates = [
-            'div[data-testid="review-comments"]',
-            "q",
-            "blockquote",
-            "p",
-        ]
-
-        for selector in candidates:
-            element = container.select_one(selector)
-            if element:
-                text = element.get_text(strip=True)
+        # Walk the container once, remembering the first element of each
+        # candidate kind in priority order, plus every <span> as a fallback.
+        # Airbnb often uses data-testid attributes for key content.
+        first_by_priority: List[Optional[Any]] = [None] * len(_COMMENT_TAG_PRIORITY)
+        spans: List[Any] = []
+        for node in container.iterdescendants(
+            "div", "span", *_COMMENT_TAG_PRIORITY[1:]
+        ):
+            tag = node.tag
+            if tag == "span":
+                spans.append(node)
+                continue
+            if tag == "div" and node.get("data-testid") != "review-comments":
+                continue
+            priority = _COMMENT_TAG_PRIORITY.index(tag)
+            if first_by_priority[priority] is None:
+                first_by_priority[priority] = node
+
+        # string(.) concatenates the text inside libxml2 in one allocation,
+        # rather than stripping and joining each text node in Python.
+        for element in first_by_priority:
+            if element is not None:
+                text = text_content(element).strip()
                 if text:
                     return text
 
-        # Fallback: look for any <span> with long text
+        # Fallback: look for any <span> with long text; each span's text is
+        # read and stripped once, and spans are compared by stripped length.
         longest_text = ""
-        for span in container.find_all("span"):
-            text = span.get_text(strip=True)
+        for span in spans:
+            text = text_content(span).strip()
+            if len(text) > _OBVIOUS_COMMENT_LENGTH:
+                return text
             if len(text) > len(longest_text):
                 longest_text = text
 
         return longest_text or None
 
-    def _extract_rating(self, container: Any) -> Optional[float]:
+    def _extract_rating(
+        self,
+        container: Any,
+        full_text: Optional[str] = None,
+    ) -> Optional[float]:
         # Look for explicit ratingValue
-        rating_element = container.find(attrs={"itemprop": "ratingValue"})
-        if rating_element and rating_element.get("content"):
+        rating_element = select_one(container, _RATING_VALUE_SELECTOR)
+        if rating_element is not None and rating_element.get("content"):
             try:
-                return float(rating_element["content"])
+                return float(rating_element.get("content"))
             except (TypeError, ValueError):
                 pass
 
         # Look for aria-label patterns like "5 out of 5"
-        for elem in container.find_all(attrs={"aria-label": True}):
-            label = elem["aria-label"]
-            match = re.search(r"(\d+(?:\.\d+)?)\s+out\s+of\s+5", label)
+        for elem in select(container, _ARIA_LABEL_SELECTOR):
+            label = elem.get("aria-label")
+            match = _ARIA_RATING_RE.search(label)
             if match:
                 try:
                     return float(match.group(1))
@@ -173,8 +516,9 @@ class ReviewParser:
                     continue
 
         # As a last resort, look for "★" patterns
-        text = container.get_text(" ", strip=True)
-        match = re.search(r"(\d+(?:\.\d+)?)\s*/\s*5", text)
+        if full_text is None:
+            full_text = get_text(container, " ")
+        match = _SLASH5_RE.search(full_text)
         if match:
             try:
                 return float(match.group(1))
@@ -188,51 +532,45 @@ class ReviewParser:
         container: Any,
     ) -> (Optional[str], Optional[str]):
         # Look for <time> element first
-        time_element = container.find("time")
+        time_element = next(container.iterdescendants("time"), None)
         date_text = None
 
-        if time_element:
-            date_text = time_element.get("datetime") or time_element.get_text(strip=True)
+        if time_element is not None:
+            date_text = time_element.get("datetime") or get_text(time_element)
 
         if not date_text:
             # Fallback: look for any span with 'date' in class or data-testid
-            for span in container.find_all("span"):
+            for span in container.iterdescendants("span"):
                 attrs = " ".join(
-                    str(v) for v in span.attrs.values() if isinstance(v, str)
+                    value
+                    for name, value in span.attrib.items()
+                    if name not in _MULTI_VALUED_ATTRIBUTES
                 )
                 if "date" in attrs.lower():
-                    date_text = span.get_text(strip=True)
+                    date_text = get_text(span)
                     break
 
         if not date_text:
             return None, None
 
-        try:
-            dt = dateparser.parse(date_text)
-        except (ValueError, TypeError, OverflowError):
-            return None, date_text  # Keep the original as "localizedDate" fallback
+        return _normalize_date(date_text)
 
-        created_at = dt.replace(tzinfo=None).isoformat() + "Z"
-        localized_date = dt.strftime("%B %Y")
-        return created_at, localized_date
-
-    def _extract_host_response(self, container: Any) -> Optional[str]:
-        candidates = [
-            'div[data-testid="review-detail-host-response"]',
-            'section[data-testid="host-response"]',
-        ]
-
-        for selector in candidates:
-            elem = container.select_one(selector)
-            if elem:
-                text = elem.get_text(" ", strip=True)
+    def _extract_host_response(
+        self,
+        container: Any,
+        full_text_nl: Optional[str] = None,
+    ) -> Optional[str]:
+        for selector in _HOST_RESPONSE_SELECTORS:
+            elem = select_one(container, selector)
+            if elem is not None:
+                text = get_text(elem, " ")
                 if text:
                     return text
 
         # Fallback: look for a "Response from" pattern
-        text = container.get_text("\n", strip=True)
-        pattern = r"Response from.*?:\s*(.+)"
-        match = re.search(pattern, text, flags=re.IGNORECASE | re.DOTALL)
+        if full_text_nl is None:
+            full_text_nl = get_text(container, "\n")
+        match = _HOST_RESPONSE_RE.search(full_text_nl)
         if match:
             response_text = match.group(1).strip()
             # Limit very long captures
@@ -248,26 +586,24 @@ class ReviewParser:
         content, not profile pictures.
         """
         photos: List[str] = []
+        seen: Set[str] = set()
 
-        # Common attributes for review photos
-        selectors = [
-            'img[data-testid="review-photo"]',
-            'img[data-original-uri]',
-        ]
-        for selector in selectors:
-            for img in container.select(selector):
+        for selector in _REVIEW_PHOTO_SELECTORS:
+            for img in select(container, selector):
                 url = img.get("data-original-uri") or img.get("src")
-                if url and url not in photos:
+                if url and url not in seen:
+                    seen.add(url)
                     photos.append(url)
 
         # Fallback: any <img> inside a dedicated photo container
         if not photos:
-            for div in container.find_all("div"):
-                classes = " ".join(div.get("class", []))
+            for div in container.iterdescendants("div"):
+                classes = div.get("class", "")
                 if any(keyword in classes.lower() for keyword in ["photo", "image"]):
-                    for img in div.find_all("img"):
+                    for img in div.iterdescendants("img"):
                         url = img.get("src")
-                        if url and url not in photos:
+                        if url and url not in seen:
+                            seen.add(url)
                             photos.append(url)
 
         return photos
\ No newline at end of file
@@ -1,9 +1,14 @@
 import logging
 import re
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional
+
+from .html_utils import get_text
 
 logger = logging.getLogger(__name__)
 
+_USER_ID_RE = re.compile(r"/users/show/(\d+)")
+_SUPERHOST_RE = re.compile(r"superhost", re.IGNORECASE)
+
 class ReviewerParser:
     """
     Extracts reviewer details from a single review container.
@@ -17,7 +22,11 @@ class ReviewerParser:
       - location
     """
 
-    def parse_reviewer(self, container: Any) -> Dict[str, Any]:
+    def parse_reviewer(
+        self,
+        container: Any,
+        full_text: Optional[str] = None,
+    ) -> Dict[str, Any]:
         reviewer: Dict[str, Any] = {
             "id": None,
             "firstName": None,
@@ -27,27 +36,40 @@ class ReviewerParser:
             "location": None,
         }
 
+        # Collect every node the helpers look at in a single subtree walk
+        links: List[Any] = []
+        images: List[Any] = []
+        text_blocks: List[Any] = []
+        for node in container.iterdescendants("a", "img", "span", "div"):
+            if node.tag == "a":
+                links.append(node)
+            elif node.tag == "img":
+                images.append(node)
+            else:
+                text_blocks.append(node)
+
         # Profile link (href usually contains /users/show/<id>)
-        profile_link = self._find_profile_link(container)
-        if profile_link:
+        profile_link = self._find_profile_link(links)
+        if profile_link is not None:
             href = profile_link.get("href")
             reviewer["profilePath"] = href
             reviewer["id"] = self._extract_user_id_from_href(href)
-            if profile_link.get_text(strip=True):
-                reviewer["firstName"] = profile_link.get_text(strip=True)
+            name = get_text(profile_link)
+            if name:
+                reviewer["firstName"] = name
 
         # Picture
-        picture = self._find_profile_picture(container)
+        picture = self._find_profile_picture(images)
         if picture:
             reviewer["pictureUrl"] = picture
 
         # Location / Airbnb activity summary
-        location = self._find_reviewer_location(container)
+        location = self._find_reviewer_location(text_blocks)
         if location:
             reviewer["location"] = location
 
         # Superhost? Usually marked by a badge or text near name
-        reviewer["isSuperhost"] = self._detect_superhost_flag(container)
+        reviewer["isSuperhost"] = self._detect_superhost_flag(container, full_text)
 
         return reviewer
 
@@ -55,31 +77,35 @@ class ReviewerParser:
     # Internal helpers
     # ------------------------------------------------------------------ #
 
-    def _find_profile_link(self, container: Any) -> Optional[Any]:
-        for link in container.find_all("a", href=True):
-            href = link["href"]
+    def _find_profile_link(self, links: List[Any]) -> Optional[Any]:
+        for link in links:
+            href = link.get("href", "")
             if "/users/show/" in href:
                 # Heuristic: first such link is usually the reviewer
                 return link
         return None
 
     def _extract_user_id_from_href(self, href: str) -> Optional[str]:
-        match = re.search(r"/users/show/(\d+)", href)
+        match = _USER_ID_RE.search(href)
         if match:
             return match.group(1)
         return None
 
-    def _find_profile_picture(self, container: Any) -> Optional[str]:
-        # Look for <img> near the profile link
-        for img in container.find_all("img"):
+    def _find_profile_picture(self, images: List[Any]) -> Optional[str]:
+        # Prefer an <img> explicitly labelled as a profile picture / avatar;
+        # otherwise fall back to the first small image likely to be an avatar.
+        small_image_src: Optional[str] = None
+        for img in images:
+            src = img.get("src")
+            if not src:
+                continue
+
             alt = img.get("alt", "").lower()
             if "profile" in alt or "avatar" in alt:
-                src = img.get("src")
-                if src:
-                    return src
+                return src
 
-        # Fallback: any small image likely to be avatar
-        for img in container.find_all("img"):
+            if small_image_src is not None:
+                continue
             width = img.get("width")
             height = img.get("height")
             if width and height:
@@ -89,16 +115,14 @@ class ReviewerParser:
                 except ValueError:
                     continue
                 if max(w, h) <= 80:  # small avatar-size image
-                    src = img.get("src")
-                    if src:
-                        return src
-        return None
+                    small_image_src = src
+        return small_image_src
 
-    def _find_reviewer_location(self, container: Any) -> Optional[str]:
+    def _find_reviewer_location(self, text_blocks: List[Any]) -> Optional[str]:
         # Airbnb often shows "X years on Airbnb" or a location near the name
         text_candidates = []
-        for elem in container.find_all(["span", "div"]):
-            text = elem.get_text(" ", strip=True)
+        for elem in text_blocks:
+            text = get_text(elem, " ")
             if not text:
                 continue
             lower = text.lower()
@@ -112,9 +136,10 @@ class ReviewerParser:
             return sorted(text_candidates, key=len)[0]
         return None
 
-    def _detect_superhost_flag(self, container: Any) -> bool:
-        text = container.get_text(" ", strip=True).lower()
-        if "superhost" in text:
+    def _detect_superhost_flag(self, container: Any, full_text: Optional[str]) -> bool:
+        if full_text is None:
+            full_text = get_text(container, " ")
+        if _SUPERHOST_RE.search(full_text):
             # Could refer to host rather than reviewer, but usually okay as a heuristic
             return True
         return False
\ No newline at end of file
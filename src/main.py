@@ -1,12 +1,13 @@
 import argparse
-import json
+import asyncio
 import logging
+import os
 import sys
-from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
-import requests
+import httpx
+import orjson
 
 # Ensure local src folder is on sys.path so we can import project modules
 CURRENT_DIR = Path(__file__).resolve().parent
@@ -18,6 +19,12 @@ from utils.data_formatter import export_reviews  # noqa: E402
 
 logger = logging.getLogger("airbnb_reviews")
 
+# Retry policy for transient failures: fetch_page retries connection errors
+# and these statuses with exponential backoff.
+MAX_RETRIES = 3
+RETRY_BACKOFF_FACTOR = 0.5
+RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+
 def setup_logging(verbose: bool = False) -> None:
     level = logging.DEBUG if verbose else logging.INFO
     logging.basicConfig(
@@ -25,6 +32,9 @@ def setup_logging(verbose: bool = False) -> None:
         format="%(asctime)s | %(levelname)s | %(name)s | %(message)s",
         datefmt="%Y-%m-%d %H:%M:%S",
     )
+    # httpx logs every request at INFO; keep them for --verbose only
+    if not verbose:
+        logging.getLogger("httpx").setLevel(logging.WARNING)
 
 def load_settings(path: Path) -> Dict[str, Any]:
     if not path.is_file():
@@ -39,8 +49,7 @@ def load_settings(path: Path) -> Dict[str, Any]:
             "concurrent_requests": 2,
         }
 
-    with path.open("r", encoding="utf-8") as f:
-        data = json.load(f)
+    data = orjson.loads(path.read_bytes())
 
     # Fill sensible defaults if missing
     data.setdefault(
@@ -61,8 +70,7 @@ def load_input(path: Path) -> Dict[str, Any]:
             "Create it or use --input-file to point to an existing JSON file."
         )
 
-    with path.open("r", encoding="utf-8") as f:
-        data = json.load(f)
+    data = orjson.loads(path.read_bytes())
 
     if "roomUrls" not in data or not isinstance(data["roomUrls"], list):
         raise ValueError(
@@ -71,39 +79,130 @@ def load_input(path: Path) -> Dict[str, Any]:
 
     return data
 
-def create_session(settings: Dict[str, Any]) -> requests.Session:
-    session = requests.Session()
-    session.headers.update(
-        {"User-Agent": settings.get("user_agent")}
+def warn_unsupported_no_proxy() -> None:
+    """
+    httpx matches NO_PROXY entries against the request host only, so CIDR
+    ranges (e.g. 10.0.0.0/8) bypass the proxy for that exact address alone.
+    """
+    no_proxy = os.environ.get("NO_PROXY") or os.environ.get("no_proxy") or ""
+    for host in no_proxy.split(","):
+        host = host.strip()
+        if "/" in host and "://" not in host:
+            logger.warning(
+                "NO_PROXY range %r is not supported; only the address itself "
+                "bypasses the proxy.",
+                host,
+            )
+
+def create_client(
+    settings: Dict[str, Any],
+    concurrent_requests: int,
+) -> httpx.AsyncClient:
+    # HTTP/2 lets concurrent requests to Airbnb share multiplexed connections,
+    # and idle ones are kept alive so later rooms skip the TLS handshake.
+    limits = httpx.Limits(
+        max_connections=concurrent_requests * 4,
+        max_keepalive_connections=concurrent_requests * 4,
+        keepalive_expiry=30,
+    )
+    verify = settings.get("verify_ssl", True)
+    warn_unsupported_no_proxy()
+
+    # Settings use requests-style proxies, e.g. {"https": "http://host:port"},
+    # and take precedence over HTTP(S)_PROXY/NO_PROXY from the environment,
+    # which httpx applies itself, as they did with requests.
+    proxies = settings.get("proxies") or {}
+    mounts = {
+        f"{scheme}://": httpx.AsyncHTTPTransport(
+            proxy=url,
+            http2=True,
+            limits=limits,
+            verify=verify,
+        )
+        for scheme, url in proxies.items()
+        if url
+    }
+
+    return httpx.AsyncClient(
+        headers={
+            "User-Agent": settings.get("user_agent"),
+            # Decoded transparently; br/zstd need brotli/zstandard installed
+            "Accept-Encoding": "gzip, br, zstd",
+        },
+        http2=True,
+        limits=limits,
+        verify=verify,
+        mounts=mounts or None,
+        follow_redirects=True,
     )
 
-    proxies = settings.get("proxies")
-    if proxies:
-        session.proxies.update(proxies)
+async def fetch_page(
+    client: httpx.AsyncClient,
+    url: str,
+    timeout: float,
+) -> httpx.Response:
+    """
+    GET ``url``, retrying failed connections, rate-limited and server-error
+    responses with exponential backoff (honouring Retry-After when the
+    server sends one).
+    """
+    for attempt in range(MAX_RETRIES + 1):
+        delay = RETRY_BACKOFF_FACTOR * (2 ** attempt)
+        try:
+            response = await client.get(url, timeout=timeout)
+        except (httpx.ConnectError, httpx.ConnectTimeout) as exc:
+            if attempt == MAX_RETRIES:
+                raise
+            logger.debug(
+                "Could not connect for %s (%s), retrying in %.1fs",
+                url,
+                exc,
+                delay,
+            )
+            await asyncio.sleep(delay)
+            continue
+
+        if response.status_code not in RETRY_STATUSES or attempt == MAX_RETRIES:
+            break
+
+        retry_after = response.headers.get("Retry-After", "")
+        if retry_after.isdigit():
+            delay = max(delay, float(retry_after))
+        logger.debug(
+            "Got HTTP %d for %s, retrying in %.1fs",
+            response.status_code,
+            url,
+            delay,
+        )
+        await asyncio.sleep(delay)
 
-    session.verify = settings.get("verify_ssl", True)
-    return session
+    response.raise_for_status()
+    return response
 
-def scrape_room(
+async def scrape_room(
     room_url: str,
-    session: requests.Session,
+    client: httpx.AsyncClient,
     parser: ReviewParser,
     settings: Dict[str, Any],
     max_items: Optional[int],
+    semaphore: asyncio.Semaphore,
 ) -> List[Dict[str, Any]]:
     timeout = settings.get("timeout", 20)
     effective_max = max_items or settings.get("max_reviews_per_room")
 
     logger.info("Scraping reviews from %s (limit=%s)", room_url, effective_max)
     try:
-        response = session.get(room_url, timeout=timeout)
-        response.raise_for_status()
-    except requests.RequestException as exc:
+        async with semaphore:
+            response = await fetch_page(client, room_url, timeout)
+    except httpx.HTTPError as exc:
         logger.error("Failed to fetch %s: %s", room_url, exc)
         return []
 
     html = response.text
-    reviews = parser.parse_reviews(
+    # Parsing is CPU-bound; keep it off the event loop so other rooms'
+    # downloads carry on meanwhile.
+    reviews = await asyncio.to_thread(
+        parser.parse_reviews,
         html=html,
         room_url=room_url,
         max_items=effective_max,
@@ -115,6 +214,39 @@ def scrape_room(
     )
     return reviews
 
+async def scrape_rooms(
+    room_urls: List[str],
+    settings: Dict[str, Any],
+    max_items: Optional[int],
+    concurrent_requests: int,
+) -> List[Dict[str, Any]]:
+    review_parser = ReviewParser()
+    # Caps the number of requests in flight at any time
+    semaphore = asyncio.Semaphore(concurrent_requests)
+
+    all_reviews: List[Dict[str, Any]] = []
+    async with create_client(settings, concurrent_requests) as client:
+        results = await asyncio.gather(
+            *[
+                scrape_room(url, client, review_parser, settings, max_items, semaphore)
+                for url in room_urls
+            ],
+            return_exceptions=True,
+        )
+
+    for url, result in zip(room_urls, results):
+        if isinstance(result, BaseException):  # pragma: no cover - defensive
+            logger.error(
+                "Unexpected error while scraping %s: %s",
+                url,
+                result,
+                exc_info=result,
+            )
+            continue
+        all_reviews.extend(result)
+
+    return all_reviews
+
 def determine_output(
     input_cfg: Dict[str, Any],
     settings: Dict[str, Any],
@@ -193,11 +325,6 @@ def main() -> None:
         logger.warning("No room URLs provided in input. Nothing to do.")
         return
 
-    session = create_session(settings)
-    review_parser = ReviewParser()
-
-    all_reviews: List[Dict[str, Any]] = []
-
     concurrent_requests = max(1, int(settings.get("concurrent_requests", 2)))
     logger.info(
         "Starting scrape for %d room(s) with concurrency=%d",
@@ -205,26 +332,9 @@ def main() -> None:
         concurrent_requests,
     )
 
-    with ThreadPoolExecutor(max_workers=concurrent_requests) as executor:
-        future_to_room = {
-            executor.submit(
-                scrape_room,
-                url,
-                session,
-                review_parser,
-                settings,
-                max_items,
-            ): url
-            for url in room_urls
-        }
-
-        for future in as_completed(future_to_room):
-            url = future_to_room[future]
-            try:
-                reviews = future.result()
-                all_reviews.extend(reviews)
-            except Exception as exc:  # pragma: no cover - defensive
-                logger.exception("Unexpected error while scraping %s: %s", url, exc)
+    all_reviews = asyncio.run(
+        scrape_rooms(room_urls, settings, max_items, concurrent_requests)
+    )
 
     logger.info(
         "Scraping complete. Collected %d review(s) across %d room(s).",
@@ -1,9 +1,11 @@
-import json
+import csv
+import html
 import logging
 from pathlib import Path
-from typing import Any, Dict, List
+from typing import Any, Dict, Iterator, List, Tuple
 
-import pandas as pd
+import orjson
+import xlsxwriter
 from xml.etree.ElementTree import Element, SubElement, ElementTree
 
 logger = logging.getLogger(__name__)
@@ -37,14 +39,14 @@ def export_reviews(
         raise ValueError(f"Unsupported output format: {output_format}")
 
 def _export_json(reviews: List[Dict[str, Any]], output_path: Path) -> None:
-    with output_path.open("w", encoding="utf-8") as f:
-        json.dump(reviews, f, ensure_ascii=False, indent=2)
+    output_path.write_bytes(
+        orjson.dumps(reviews, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    )
     logger.info("Wrote %d review(s) to JSON: %s", len(reviews), output_path)
 
 def _export_jsonl(reviews: List[Dict[str, Any]], output_path: Path) -> None:
-    with output_path.open("w", encoding="utf-8") as f:
-        for row in reviews:
-            f.write(json.dumps(row, ensure_ascii=False) + "\n")
+    lines = b"\n".join(orjson.dumps(row) for row in reviews)
+    output_path.write_bytes(lines + b"\n" if lines else lines)
     logger.info("Wrote %d review(s) to JSONL: %s", len(reviews), output_path)
 
 def _export_tabular(
@@ -52,23 +54,118 @@ def _export_tabular(
     output_path: Path,
     kind: str,
 ) -> None:
-    # Flatten nested dictionaries using pandas.json_normalize
-    df = pd.json_normalize(reviews)
+    # Nested dictionaries are flattened into "reviewer.firstName"-style
+    # columns; rows are flattened and written one at a time.
+    columns = _collect_columns(reviews)
 
     if kind == "csv":
-        df.to_csv(output_path, index=False)
-        logger.info("Wrote %d review(s) to CSV: %s", len(df), output_path)
+        _write_csv(reviews, columns, output_path)
+        logger.info("Wrote %d review(s) to CSV: %s", len(reviews), output_path)
     elif kind == "excel":
-        df.to_excel(output_path, index=False)
-        logger.info("Wrote %d review(s) to Excel: %s", len(df), output_path)
+        _write_excel(reviews, columns, output_path)
+        logger.info("Wrote %d review(s) to Excel: %s", len(reviews), output_path)
     elif kind == "html":
-        html = df.to_html(index=False, border=0)
-        with output_path.open("w", encoding="utf-8") as f:
-            f.write(html)
-        logger.info("Wrote %d review(s) to HTML: %s", len(df), output_path)
+        _write_html(reviews, columns, output_path)
+        logger.info("Wrote %d review(s) to HTML: %s", len(reviews), output_path)
     else:  # pragma: no cover - defensive
         raise ValueError(f"Unsupported tabular kind: {kind}")
 
+def _flatten(data: Dict[str, Any]) -> Iterator[Tuple[str, Any]]:
+    """
+    Yield ``(column, value)`` pairs for a review, joining nested keys with
+    dots. Lists are kept as single values. As with pandas.json_normalize,
+    the top-level leaf values come first, followed by the nested dicts.
+    """
+    nested = []
+    for key, value in data.items():
+        if isinstance(value, dict) and value:
+            nested.append((key, value))
+        else:
+            yield key, value
+    for key, value in nested:
+        yield from _flatten_nested(value, key + ".")
+
+def _flatten_nested(data: Dict[str, Any], prefix: str) -> Iterator[Tuple[str, Any]]:
+    for key, value in data.items():
+        column = prefix + key
+        if isinstance(value, dict) and value:
+            yield from _flatten_nested(value, column + ".")
+        else:
+            yield column, value
+
+def _collect_columns(reviews: List[Dict[str, Any]]) -> List[str]:
+    """Union of the flattened columns of all reviews, in first-seen order."""
+    columns: Dict[str, None] = {}
+    for review in reviews:
+        for column, _ in _flatten(review):
+            columns.setdefault(column)
+    return list(columns)
+
+def _cell_text(value: Any) -> str:
+    return "" if value is None else str(value)
+
+def _write_csv(
+    reviews: List[Dict[str, Any]],
+    columns: List[str],
+    output_path: Path,
+) -> None:
+    with output_path.open("w", encoding="utf-8", newline="") as f:
+        writer = csv.DictWriter(f, fieldnames=columns)
+        writer.writeheader()
+        for review in reviews:
+            writer.writerow(dict(_flatten(review)))
+
+def _write_excel(
+    reviews: List[Dict[str, Any]],
+    columns: List[str],
+    output_path: Path,
+) -> None:
+    # constant_memory flushes each row to disk once the next one starts.
+    # Strings are written verbatim: auto-linking would turn every URL into a
+    # hyperlink (and drop cells past Excel's 65,530 link limit), and a
+    # comment starting with "=" must not become a formula.
+    workbook = xlsxwriter.Workbook(
+        str(output_path),
+        {
+            "constant_memory": True,
+            "strings_to_urls": False,
+            "strings_to_formulas": False,
+        },
+    )
+    try:
+        worksheet = workbook.add_worksheet()
+        worksheet.write_row(0, 0, columns)
+        for row_idx, review in enumerate(reviews, start=1):
+            row = dict(_flatten(review))
+            for col_idx, column in enumerate(columns):
+                value = row.get(column)
+                if value is None:
+                    continue
+                if isinstance(value, (list, dict)):
+                    value = str(value)
+                worksheet.write(row_idx, col_idx, value)
+    finally:
+        workbook.close()
+
+def _write_html(
+    reviews: List[Dict[str, Any]],
+    columns: List[str],
+    output_path: Path,
+) -> None:
+    with output_path.open("w", encoding="utf-8") as f:
+        f.write('<table border="0" class="dataframe">\n')
+        f.write("  <thead>\n    <tr>\n")
+        for column in columns:
+            f.write(f"      <th>{html.escape(column)}</th>\n")
+        f.write("    </tr>\n  </thead>\n  <tbody>\n")
+        for review in reviews:
+            row = dict(_flatten(review))
+            f.write("    <tr>\n")
+            for column in columns:
+                f.write(f"      <td>{html.escape(_cell_text(row.get(column)))}</td>\n")
+            f.write("    </tr>\n")
+        f.write("  </tbody>\n</table>\n")
+
 def _export_xml(reviews: List[Dict[str, Any]], output_path: Path) -> None:
     root = Element("reviews")
 
@@ -85,14 +182,25 @@ def _populate_xml(parent: Element, data: Any, prefix: str = "") -> None:
     Recursively populate XML elements from nested dict/list structures.
     Keys with dots are converted to underscores for valid tag names.
     """
-    if isinstance(data, dict):
-        for key, value in data.items():
-            tag = (prefix + key).replace(".", "_")
-            child = SubElement(parent, tag)
-            _populate_xml(child, value)
-    elif isinstance(data, list):
-        for item in data:
-            child = SubElement(parent, "item")
-            _populate_xml(child, item)
-    else:
-        parent.text = "" if data is None else str(data)
\ No newline at end of file
+    _XML_HANDLERS.get(type(data), _populate_xml_leaf)(parent, data, prefix)
+
+def _populate_xml_dict(parent: Element, data: Dict[str, Any], prefix: str) -> None:
+    for key, value in data.items():
+        child = SubElement(parent, (prefix + key).translate(_TAG_TRANSLATE))
+        _XML_HANDLERS.get(type(value), _populate_xml_leaf)(child, value, "")
+
+def _populate_xml_list(parent: Element, data: List[Any], prefix: str) -> None:
+    for item in data:
+        child = SubElement(parent, "item")
+        _XML_HANDLERS.get(type(item), _populate_xml_leaf)(child, item, "")
+
+def _populate_xml_leaf(parent: Element, data: Any, prefix: str) -> None:
+    parent.text = "" if data is None else str(data)
+
+_TAG_TRANSLATE = str.maketrans({".": "_"})
+
+# Dispatch on the exact type: review data only holds plain dicts and lists
+_XML_HANDLERS = {
+    dict: _populate_xml_dict,
+    list: _populate_xml_list,
+}